@@ -5,13 +5,13 @@ Provides a user-friendly way to run the scraper with various options
 
 import click
 import os
+from collections import Counter
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich.text import Text
 from dotenv import load_dotenv
-from sparkscraper_enhanced import EnhancedSparkScraper
 from config import SparkScraperConfig
 
 # Load environment variables
@@ -36,6 +36,8 @@ def cli():
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
 def scrape(keywords, subreddits, output, limit, verbose):
     """Scrape project ideas from multiple sources"""
+    # Imported here so other commands don't pay for the scraping dependencies
+    from sparkscraper_enhanced import EnhancedSparkScraper
     
     # Display welcome message
     welcome_text = Text("🚀 SparkScraper v2.0", style="bold blue")
@@ -93,19 +95,14 @@ def scrape(keywords, subreddits, output, limit, verbose):
         try:
             scraper = EnhancedSparkScraper()
             
-            progress.update(task, description="Scraping Reddit...")
-            reddit_ideas = scraper.scrape_reddit_enhanced(subreddits_list, keywords_list)
-            
-            progress.update(task, description="Scraping Twitter...")
-            twitter_ideas = scraper.scrape_twitter_enhanced(keywords_list)
-            
-            progress.update(task, description="Scraping LinkedIn...")
-            linkedin_ideas = scraper.scrape_linkedin_enhanced(keywords_list)
+            # All three sources are scraped concurrently
+            progress.update(task, description="Scraping Reddit, Twitter and LinkedIn...")
+            all_ideas = scraper.scrape_all(keywords_list, subreddits_list)
             
             progress.update(task, description="Processing and saving results...")
             
-            all_ideas = reddit_ideas + twitter_ideas + linkedin_ideas
             scraper.save_output(all_ideas, output)
+            scraper.processor.save_seen_ideas()
             
             progress.update(task, description="Complete!")
             
@@ -118,9 +115,10 @@ def scrape(keywords, subreddits, output, limit, verbose):
     results_table.add_column("Source", style="cyan")
     results_table.add_column("Ideas Found", style="green")
     
-    results_table.add_row("Reddit", str(len(reddit_ideas)))
-    results_table.add_row("Twitter", str(len(twitter_ideas)))
-    results_table.add_row("LinkedIn", str(len(linkedin_ideas)))
+    source_counts = Counter(idea["source"] for idea in all_ideas)
+    results_table.add_row("Reddit", str(source_counts["reddit"]))
+    results_table.add_row("Twitter", str(source_counts["twitter"]))
+    results_table.add_row("LinkedIn", str(source_counts["linkedin"]))
     results_table.add_row("Total", str(len(all_ideas)))
     
     console.print(results_table)
@@ -161,6 +159,7 @@ def config():
     
     settings_table.add_row("Default Keywords", ", ".join(SparkScraperConfig.DEFAULT_KEYWORDS[:3]) + "...")
     settings_table.add_row("Default Subreddits", ", ".join(SparkScraperConfig.DEFAULT_SUBREDDITS[:3]) + "...")
+    settings_table.add_row("Rate Limit Mode", SparkScraperConfig.RATE_LIMIT_MODE.name.title())
     settings_table.add_row("Rate Limit Delay", f"{SparkScraperConfig.RATE_LIMIT_DELAY}s")
     settings_table.add_row("Max Reddit Posts", str(SparkScraperConfig.MAX_REDDIT_POSTS))
     settings_table.add_row("Max Twitter Tweets", str(SparkScraperConfig.MAX_TWITTER_TWEETS))
@@ -172,6 +171,8 @@ def config():
               default='markdown', help='Output format for the sample')
 def sample(format):
     """Generate a sample output file with mock data"""
+    from itertools import chain, repeat
+    from sparkscraper_enhanced import EnhancedSparkScraper
     from test_sparkscraper import TestSparkScraper
     
     console.print("Generating sample output...")
@@ -182,11 +183,11 @@ def sample(format):
     
     # Create mock scraper and save sample
     scraper = EnhancedSparkScraper()
-    all_ideas = (
-        scraper.processor.process_ideas(test_instance.test_reddit_ideas, "reddit") +
-        scraper.processor.process_ideas(test_instance.test_twitter_ideas, "twitter") +
-        scraper.processor.process_ideas(test_instance.test_linkedin_ideas, "linkedin")
-    )
+    all_ideas = list(scraper.processor.process_ideas_batched(chain(
+        zip(test_instance.test_reddit_ideas, repeat("reddit")),
+        zip(test_instance.test_twitter_ideas, repeat("twitter")),
+        zip(test_instance.test_linkedin_ideas, repeat("linkedin"))
+    )))
     
     scraper.save_output(all_ideas, [format])
     
@@ -3,8 +3,47 @@ Configuration file for SparkScraper
 Centralizes all settings and API configurations
 """
 
+import logging
 import os
-from typing import List, Dict, Any
+from enum import Enum
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+class RateLimitMode(Enum):
+    """Base delay in seconds between requests to the same source"""
+    AGGRESSIVE = 0.1
+    FAST = 0.3
+    NORMAL = 1.0
+    CONSERVATIVE = 2.5
+
+def _rate_limit_mode(name: str) -> RateLimitMode:
+    """Look up a rate limit mode by name, falling back to FAST for unknown names"""
+    try:
+        return RateLimitMode[name.upper()]
+    except KeyError:
+        valid = ", ".join(mode.name.lower() for mode in RateLimitMode)
+        logging.getLogger(__name__).warning(
+            f"Unknown SPARKSCRAPER_RATE_LIMIT_MODE '{name}' (expected one of: {valid}); using fast"
+        )
+        return RateLimitMode.FAST
+
+# The environment is read once per process; results are tuples so they can be cached
+@lru_cache(maxsize=None)
+def _env_list(name: str) -> Optional[Tuple[str, ...]]:
+    """Split a comma-separated environment variable"""
+    value = os.getenv(name)
+    if value:
+        return tuple(item.strip() for item in value.split(","))
+    return None
+
+@lru_cache(maxsize=None)
+def _validate_config() -> Tuple[Tuple[str, bool], ...]:
+    """Validation results; the credentials are fixed once the module has loaded"""
+    return (
+        ("reddit_configured", bool(SparkScraperConfig.REDDIT_CONFIG["client_id"] != "YOUR_REDDIT_CLIENT_ID")),
+        ("twitter_configured", bool(SparkScraperConfig.TWITTER_CONFIG["consumer_key"] != "YOUR_TWITTER_API_KEY")),
+        ("output_writable", True)  # Will be checked at runtime
+    )
 
 class SparkScraperConfig:
     """Configuration class for SparkScraper"""
@@ -45,14 +84,32 @@ class SparkScraperConfig:
     ]
     
     # Rate Limiting
-    RATE_LIMIT_DELAY = 1.0  # seconds between requests
+    # Throttling is paced by the mode; backoff only kicks in on observed 429s
+    RATE_LIMIT_MODE = _rate_limit_mode(os.getenv("SPARKSCRAPER_RATE_LIMIT_MODE", "FAST"))
+    RATE_LIMIT_DELAY = RATE_LIMIT_MODE.value  # seconds between requests
+    MAX_CONCURRENT_REQUESTS = 8  # in-flight requests per source
+    MAX_RETRIES = 4
+    RETRY_BACKOFF = 1.0  # seconds, doubled on each retry
+    RETRY_MAX_WAIT = 30.0
+    RETRY_STATUS_CODES = [429, 502, 503]
+    
+    # HTTP connection pooling for the aiohttp session
+    CONNECTION_POOL_SIZE = 20
+    KEEPALIVE_TIMEOUT = 60  # seconds an idle connection stays open
+    DNS_CACHE_TTL = 300  # seconds
+    MAX_RESPONSE_BYTES = 2_000_000  # larger scraped pages are skipped or truncated
     MAX_REDDIT_POSTS = 100
     MAX_TWITTER_TWEETS = 100
     MAX_LINKEDIN_POSTS = 50
     
+    # Caching of raw scrape results between runs (0 disables)
+    CACHE_DIR = os.path.expanduser(os.getenv("SPARKSCRAPER_CACHE_DIR", "~/.cache/sparkscraper"))
+    CACHE_TTL = float(os.getenv("SPARKSCRAPER_CACHE_TTL", "3600"))  # seconds
+    
     # Output Configuration
     OUTPUT_FILENAME = "sparkscraper_ideas.md"
     OUTPUT_FORMATS = ["markdown", "json", "csv"]
+    PRETTY_JSON = os.getenv("SPARKSCRAPER_PRETTY", "").lower() in ("1", "true", "yes")  # indent JSON output
     
     # Filtering Configuration
     MIN_WORD_COUNT = 5
@@ -62,6 +119,11 @@ class SparkScraperConfig:
         "limited time", "offer", "discount", "sale"
     ]
     
+    # Duplicate detection (Bloom filter; set SPARKSCRAPER_SEEN_FILE to dedupe across runs)
+    SEEN_IDEAS_CAPACITY = 10_000
+    SEEN_IDEAS_ERROR_RATE = 1e-4
+    SEEN_IDEAS_FILE = os.getenv("SPARKSCRAPER_SEEN_FILE")
+    
     # Categories for organizing ideas
     IDEA_CATEGORIES = {
         "web_app": ["web", "app", "website", "platform", "dashboard"],
@@ -86,25 +148,20 @@ class SparkScraperConfig:
     @classmethod
     def get_keywords(cls) -> List[str]:
         """Get keywords from environment or use defaults"""
-        env_keywords = os.getenv("SPARKSCRAPER_KEYWORDS")
+        env_keywords = _env_list("SPARKSCRAPER_KEYWORDS")
         if env_keywords:
-            return [kw.strip() for kw in env_keywords.split(",")]
+            return list(env_keywords)
         return cls.DEFAULT_KEYWORDS
     
     @classmethod
     def get_subreddits(cls) -> List[str]:
         """Get subreddits from environment or use defaults"""
-        env_subreddits = os.getenv("SPARKSCRAPER_SUBREDDITS")
+        env_subreddits = _env_list("SPARKSCRAPER_SUBREDDITS")
         if env_subreddits:
-            return [sub.strip() for sub in env_subreddits.split(",")]
+            return list(env_subreddits)
         return cls.DEFAULT_SUBREDDITS
     
     @classmethod
     def validate_config(cls) -> Dict[str, bool]:
         """Validate that all required configuration is present"""
-        validation = {
-            "reddit_configured": bool(cls.REDDIT_CONFIG["client_id"] != "YOUR_REDDIT_CLIENT_ID"),
-            "twitter_configured": bool(cls.TWITTER_CONFIG["consumer_key"] != "YOUR_TWITTER_API_KEY"),
-            "output_writable": True  # Will be checked at runtime
-        }
-        return validation 
\ No newline at end of file
+        return dict(_validate_config()) 
\ No newline at end of file
@@ -1,8 +1,14 @@
 import praw
 import tweepy
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+from selectolax.lexbor import LexborHTMLParser
+import os
 import time
+import re
+from pathlib import Path
+from typing import Dict
+from config import SparkScraperConfig
 
 # --- Reddit Setup ---
 reddit = praw.Reddit(
@@ -20,64 +26,129 @@ auth = tweepy.OAuth1UserHandler(
 )
 twitter_api = tweepy.API(auth)
 
+# --- Caches ---
+# Both live under the shared cache directory and are only created once a scrape runs
+def twitter_cache():
+    # Repeated queries within the hour are answered from disk instead of the API
+    if twitter_api.cache is None:
+        os.makedirs(SparkScraperConfig.CACHE_DIR, exist_ok=True)
+        twitter_api.cache = tweepy.cache.FileCache(
+            os.path.join(SparkScraperConfig.CACHE_DIR, "twitter"), timeout=3600
+        )
+
+def http_cache():
+    # Re-running with the same keywords serves LinkedIn pages (including 404s) from SQLite
+    os.makedirs(SparkScraperConfig.CACHE_DIR, exist_ok=True)
+    return SQLiteBackend(
+        os.path.join(SparkScraperConfig.CACHE_DIR, "http"), expire_after=3600, allowed_codes=(200, 404)
+    )
+
+# LinkedIn URLs that came back 404 or without any posts, mapped to when to retry them
+NEGATIVE_CACHE: Dict[str, float] = {}
+NEGATIVE_CACHE_TTL = 600
+
+def _negative_cached(url, now):
+    retry_at = NEGATIVE_CACHE.get(url)
+    if retry_at is None:
+        return False
+    if retry_at <= now:
+        # Expired; forget it so the cache doesn't grow without bound
+        del NEGATIVE_CACHE[url]
+        return False
+    return True
+
 # --- Functions to Scrape Data ---
+# Matches posts that mention a project or an idea, in any case
+_KEYWORD_RE = re.compile(r"project|idea", re.IGNORECASE)
+
 def scrape_reddit(subreddit_name, keyword, limit=100):
-    project_ideas = []
     subreddit = reddit.subreddit(subreddit_name)
-    for submission in subreddit.search(keyword, limit=limit):
-        if "project" in submission.title.lower() or "idea" in submission.title.lower():
-            project_ideas.append(submission.title)
-    return project_ideas
+    titles = (submission.title for submission in subreddit.search(keyword, limit=limit))
+    return [title for title in titles if _KEYWORD_RE.search(title)]
 
 def scrape_twitter(keyword, count=100):
-    project_ideas = []
+    twitter_cache()
     tweets = twitter_api.search_tweets(q=keyword, count=count, tweet_mode="extended")
-    for tweet in tweets:
-        text = tweet.full_text
-        if "project" in text.lower() or "idea" in text.lower():
-            project_ideas.append(text)
-    return project_ideas
+    texts = (tweet.full_text for tweet in tweets)
+    return [text for text in texts if _KEYWORD_RE.search(text)]
 
-def scrape_linkedin(keyword):
+async def _fetch(session, url):
+    async with session.get(url) as response:
+        return await response.text()
+
+async def scrape_linkedin_async(keyword, pages=1):
     # Note: LinkedIn scraping is tricky due to login walls and ToS.
     url = f"https://www.linkedin.com/search/results/content/?keywords={keyword}"
+    urls = [url if page == 1 else f"{url}&page={page}" for page in range(1, pages + 1)]
+    now = time.time()
+    urls = [u for u in urls if not _negative_cached(u, now)]
+    if not urls:
+        return []
     headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, "html.parser")
-    posts = soup.find_all("div", class_="search-result__info")  # Adjust selector
+    # Fetch all result pages at once instead of one after another
+    async with CachedSession(cache=http_cache(), headers=headers) as session:
+        html_pages = await asyncio.gather(*[_fetch(session, u) for u in urls])
     project_ideas = []
-    for post in posts:
-        text = post.get_text().strip()
-        if "project" in text.lower() or "idea" in text.lower():
-            project_ideas.append(text)
+    for url, html in zip(urls, html_pages):
+        tree = LexborHTMLParser(html)
+        posts = tree.css("div.search-result__info")  # Adjust selector
+        if not posts:
+            # Also covers 404s, whose pages have no results
+            NEGATIVE_CACHE[url] = time.time() + NEGATIVE_CACHE_TTL
+        for post in posts:
+            text = post.text().strip()
+            if _KEYWORD_RE.search(text):
+                project_ideas.append(text)
     return project_ideas
 
+def scrape_linkedin(keyword, pages=1):
+    return asyncio.run(scrape_linkedin_async(keyword, pages))
+
+# --- Concurrent Scraping ---
+async def scrape_reddit_async(subreddit_name, keyword, limit=100):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, scrape_reddit, subreddit_name, keyword, limit)
+
+async def scrape_twitter_async(keyword, count=100):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, scrape_twitter, keyword, count)
+
+async def scrape_all(subreddit_name, keyword):
+    # Overlap all three platforms instead of waiting on each in turn
+    return await asyncio.gather(
+        scrape_reddit_async(subreddit_name, keyword),
+        scrape_twitter_async(keyword),
+        scrape_linkedin_async(keyword)
+    )
+
 # --- Generate Markdown ---
-def generate_markdown(reddit_ideas, twitter_ideas, linkedin_ideas):
-    with open("sparkscraper_ideas.md", "w") as f:
-        f.write("# SparkScraper Project Ideas\n\n")
-        f.write("Generated by SparkScraper - Harvesting inspiration from the web!\n\n")
-        
-        f.write("## From Reddit\n")
-        for i, idea in enumerate(reddit_ideas, 1):
-            f.write(f"{i}. {idea}\n")
-        
-        f.write("\n## From Twitter/X\n")
-        for i, idea in enumerate(twitter_ideas, 1):
-            f.write(f"{i}. {idea}\n")
-        
-        f.write("\n## From LinkedIn\n")
-        for i, idea in enumerate(linkedin_ideas, 1):
-            f.write(f"{i}. {idea}\n")
+def generate_markdown(reddit_ideas, twitter_ideas, linkedin_ideas, *, out=None):
+    parts = [
+        "# SparkScraper Project Ideas\n\n",
+        "Generated by SparkScraper - Harvesting inspiration from the web!\n\n",
+        "## From Reddit\n"
+    ]
+    parts.extend(f"{i}. {idea}\n" for i, idea in enumerate(reddit_ideas, 1))
+    
+    parts.append("\n## From Twitter/X\n")
+    parts.extend(f"{i}. {idea}\n" for i, idea in enumerate(twitter_ideas, 1))
+    
+    parts.append("\n## From LinkedIn\n")
+    parts.extend(f"{i}. {idea}\n" for i, idea in enumerate(linkedin_ideas, 1))
+    
+    # Write the whole document in one call instead of one write per line
+    if out is None:
+        Path("sparkscraper_ideas.md").write_text("".join(parts))
+    else:
+        out.write("".join(parts))
 
 # --- Main Execution ---
 if __name__ == "__main__":
     keyword = "project ideas"  # Customize your search term
     subreddit = "sideprojects"  # Customize subreddit
     
-    reddit_ideas = scrape_reddit(subreddit, keyword)
-    twitter_ideas = scrape_twitter(keyword)
-    linkedin_ideas = scrape_linkedin(keyword)  # Be cautious with this
+    # LinkedIn scraping is included here; be cautious with it
+    reddit_ideas, twitter_ideas, linkedin_ideas = asyncio.run(scrape_all(subreddit, keyword))
     
     generate_markdown(reddit_ideas, twitter_ideas, linkedin_ideas)
     print("Project ideas saved to sparkscraper_ideas.md by SparkScraper!")
\ No newline at end of file
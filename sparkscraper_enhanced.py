@@ -3,21 +3,28 @@ Enhanced SparkScraper with advanced features
 Includes idea categorization, sentiment analysis, duplicate detection, and multiple output formats
 """
 
-import praw
-import tweepy
-import requests
-from bs4 import BeautifulSoup
-import time
+import aiohttp
+import asyncio
+from selectolax.lexbor import LexborHTMLParser
 import json
+import orjson
 import csv
+import os
 import re
-import logging
-from datetime import datetime
-from typing import List, Dict, Any, Tuple
-from collections import Counter
+import time
 import hashlib
-from textblob import TextBlob
-from config import SparkScraperConfig
+import logging
+from datetime import datetime, timezone
+from typing import IO, List, Dict, Any, AsyncIterator, BinaryIO, Callable, Iterable, Iterator, Optional, Tuple, TextIO
+from collections import Counter, defaultdict
+from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential, before_sleep_log
+import ahocorasick
+from pybloom_live import ScalableBloomFilter
+import xxhash
+from config import SparkScraperConfig, RateLimitMode
 
 # Set up logging
 logging.basicConfig(
@@ -30,100 +37,276 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Scraped posts are only kept if they mention a project or an idea
+_KEYWORD_RE = re.compile(r"project|idea", re.IGNORECASE)
+
+def _is_throttled(exc: BaseException) -> bool:
+    """Whether an API error means we are being rate limited"""
+    import prawcore
+    import tweepy
+    
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status in SparkScraperConfig.RETRY_STATUS_CODES
+    return isinstance(exc, (prawcore.exceptions.TooManyRequests, tweepy.errors.TooManyRequests))
+
+# Exponential backoff, applied only when an API actually pushes back
+retry_throttled = retry(
+    retry=retry_if_exception(_is_throttled),
+    stop=stop_after_attempt(SparkScraperConfig.MAX_RETRIES + 1),
+    wait=wait_exponential(multiplier=SparkScraperConfig.RETRY_BACKOFF, max=SparkScraperConfig.RETRY_MAX_WAIT),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+
+class TokenBucket:
+    """Async token bucket allowing `burst` requests at once, refilled at `rate` per second"""
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    @classmethod
+    def for_mode(cls, mode: RateLimitMode) -> "TokenBucket":
+        """Build the bucket for a rate limit mode; only AGGRESSIVE allows bursts"""
+        burst = SparkScraperConfig.MAX_CONCURRENT_REQUESTS if mode is RateLimitMode.AGGRESSIVE else 1
+        return cls(1.0 / mode.value, burst)
+    
+    async def acquire(self):
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
 class IdeaProcessor:
     """Process and analyze scraped ideas"""
     
+    URL_RE = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+    SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.\!\?\-]')
+    # Below this many ideas, pandas overhead outweighs the vectorization win
+    VECTORIZE_MIN_BATCH = 64
+    
     def __init__(self):
-        self.seen_ideas = set()
+        self.seen_ideas = self._load_seen_ideas()
         self.idea_categories = SparkScraperConfig.IDEA_CATEGORIES
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        self._sentiment_analyzer = SentimentIntensityAnalyzer()
+        # One automaton over every category keyword, so an idea is scanned once
+        self._category_matcher = ahocorasick.Automaton()
+        for category, keywords in self.idea_categories.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                matched = self._category_matcher.get(keyword, ())
+                self._category_matcher.add_word(keyword, matched + (category,))
+        self._category_matcher.make_automaton()
+        self._excl_re = re.compile(
+            "|".join(re.escape(word) for word in SparkScraperConfig.EXCLUDED_WORDS),
+            re.IGNORECASE
+        )
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+        text = self.URL_RE.sub('', text)
         # Remove special characters but keep basic punctuation
-        text = re.sub(r'[^\w\s\.\!\?\-]', '', text)
+        text = self.SPECIAL_CHARS_RE.sub('', text)
         # Normalize whitespace
         text = ' '.join(text.split())
         return text.strip()
     
-    def is_duplicate(self, idea: str) -> bool:
-        """Check if idea is a duplicate using hash"""
-        idea_hash = hashlib.md5(idea.lower().encode()).hexdigest()
-        if idea_hash in self.seen_ideas:
-            return True
-        self.seen_ideas.add(idea_hash)
-        return False
+    def _load_seen_ideas(self) -> ScalableBloomFilter:
+        """Load the duplicate filter saved by a previous run, or start a new one"""
+        path = SparkScraperConfig.SEEN_IDEAS_FILE
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    return ScalableBloomFilter.fromfile(f)
+            except Exception as e:
+                logger.warning(f"Could not load seen ideas from {path}: {e}")
+        
+        return ScalableBloomFilter(
+            initial_capacity=SparkScraperConfig.SEEN_IDEAS_CAPACITY,
+            error_rate=SparkScraperConfig.SEEN_IDEAS_ERROR_RATE
+        )
+    
+    def reset(self):
+        """Forget ideas seen since the last run (keeps anything persisted to disk)"""
+        self.seen_ideas = self._load_seen_ideas()
     
-    def categorize_idea(self, idea: str) -> List[str]:
-        """Categorize idea based on keywords"""
-        idea_lower = idea.lower()
-        categories = []
+    def save_seen_ideas(self):
+        """Persist the duplicate filter so the next run skips ideas seen in this one"""
+        path = SparkScraperConfig.SEEN_IDEAS_FILE
+        if not path:
+            return
         
-        for category, keywords in self.idea_categories.items():
-            if any(keyword in idea_lower for keyword in keywords):
-                categories.append(category)
+        try:
+            with open(path, 'wb') as f:
+                self.seen_ideas.tofile(f)
+        except OSError as e:
+            logger.error(f"Error saving seen ideas to {path}: {e}")
+    
+    def is_duplicate(self, text_lower: str) -> bool:
+        """Check if an idea (already lowercased) is a duplicate of one already seen"""
+        # Key on a fixed-size digest so the filter's salted hashes never rescan the text;
+        # add() reports whether the key was already present
+        return self.seen_ideas.add(xxhash.xxh3_64_hexdigest(text_lower.casefold().encode()))
+    
+    def categorize_idea(self, text_lower: str) -> List[str]:
+        """Categorize an idea (already lowercased) based on keywords"""
+        found = {category for _, matched in self._category_matcher.iter(text_lower) for category in matched}
+        categories = [category for category in self.idea_categories if category in found]
         
         return categories if categories else ["general"]
     
     def analyze_sentiment(self, idea: str) -> float:
-        """Analyze sentiment of idea using TextBlob"""
+        """Analyze sentiment of idea using VADER"""
         try:
-            blob = TextBlob(idea)
-            return blob.sentiment.polarity
+            return self._sentiment_analyzer.polarity_scores(idea)["compound"]
         except:
             return 0.0
     
-    def filter_idea(self, idea: str) -> bool:
-        """Filter ideas based on quality criteria"""
+    def filter_idea(self, text: str, text_lower: str, word_count: int) -> bool:
+        """Filter ideas based on quality criteria, cheapest check first"""
         # Check word count
-        word_count = len(idea.split())
         if word_count < SparkScraperConfig.MIN_WORD_COUNT or word_count > SparkScraperConfig.MAX_WORD_COUNT:
             return False
         
         # Check for excluded words
-        idea_lower = idea.lower()
-        if any(excluded in idea_lower for excluded in SparkScraperConfig.EXCLUDED_WORDS):
+        if self._excl_re.search(text):
             return False
         
         # Check for duplicates
-        if self.is_duplicate(idea):
+        if self.is_duplicate(text_lower):
             return False
         
         return True
     
+    def _process_ideas_vec(self, ideas: List[str], source: str) -> List[Dict[str, Any]]:
+        """Vectorized process_ideas for large batches, using pandas string methods"""
+        import pandas as pd
+        
+        df = pd.DataFrame({"raw": pd.Series(ideas, dtype=object)})
+        
+        text = df["raw"].str.replace(self.URL_RE, "", regex=True).str.replace(self.SPECIAL_CHARS_RE, "", regex=True)
+        words = text.str.split()
+        df["text"] = words.str.join(" ")
+        df["word_count"] = words.str.len()
+        
+        # Same checks as filter_idea, cheapest first; lowercase once for the rest
+        df = df[df["word_count"].between(SparkScraperConfig.MIN_WORD_COUNT, SparkScraperConfig.MAX_WORD_COUNT)]
+        df = df[~df["text"].str.contains(self._excl_re)]
+        df = df.assign(lower=df["text"].str.lower())
+        df = df[~df["lower"].map(self.is_duplicate).astype(bool)]
+        
+        df = df.assign(
+            source=source,
+            categories=df["lower"].map(self.categorize_idea),
+            sentiment=df["text"].map(self.analyze_sentiment),
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+        
+        columns = ["text", "source", "categories", "sentiment", "word_count", "timestamp"]
+        return df[columns].to_dict(orient="records")
+    
+    def _process_idea(self, idea: str, source: str, timestamp: str) -> Optional[Dict[str, Any]]:
+        """Process one idea, or return None if it is filtered out"""
+        cleaned_idea = self.clean_text(idea)
+        idea_lower = cleaned_idea.lower()
+        # clean_text leaves exactly one space between words
+        word_count = cleaned_idea.count(" ") + 1 if cleaned_idea else 0
+        
+        # Categorization and sentiment only run on ideas that survive
+        if not self.filter_idea(cleaned_idea, idea_lower, word_count):
+            return None
+        
+        return {
+            "text": cleaned_idea,
+            "source": source,
+            "categories": self.categorize_idea(idea_lower),
+            "sentiment": self.analyze_sentiment(cleaned_idea),
+            "word_count": word_count,
+            "timestamp": timestamp
+        }
+    
     def process_ideas(self, ideas: List[str], source: str) -> List[Dict[str, Any]]:
         """Process a list of ideas and return structured data"""
-        processed_ideas = []
+        if len(ideas) >= self.VECTORIZE_MIN_BATCH:
+            return self._process_ideas_vec(ideas, source)
         
-        for idea in ideas:
-            cleaned_idea = self.clean_text(idea)
-            
-            if not self.filter_idea(cleaned_idea):
-                continue
-            
-            processed_idea = {
-                "text": cleaned_idea,
-                "source": source,
-                "categories": self.categorize_idea(cleaned_idea),
-                "sentiment": self.analyze_sentiment(cleaned_idea),
-                "word_count": len(cleaned_idea.split()),
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            processed_ideas.append(processed_idea)
+        return list(self.process_ideas_batched((idea, source) for idea in ideas))
+    
+    def process_ideas_batched(self, items: Iterable[Tuple[str, str]]) -> Iterator[Dict[str, Any]]:
+        """Process (idea, source) pairs from any mix of sources in a single pass"""
+        # Ideas in one batch were scraped together; stamp them all alike
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
+        for idea, source in items:
+            processed_idea = self._process_idea(idea, source, timestamp)
+            if processed_idea is not None:
+                yield processed_idea
+
+class ResultCache:
+    """On-disk JSON cache of raw scrape results, expired by file mtime"""
+    
+    def __init__(self, directory: str, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+    
+    def _path(self, *key: str) -> str:
+        digest = hashlib.sha1(json.dumps(key).encode()).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+    
+    def get(self, *key: str) -> Optional[list]:
+        """Return the cached result for key, or None if missing or expired"""
+        if self.ttl <= 0:
+            return None
         
-        return processed_ideas
+        path = self._path(*key)
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl:
+                return None
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def set(self, value: list, *key: str):
+        """Store a result for key"""
+        if self.ttl <= 0:
+            return
+        
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._path(*key), 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry: {e}")
 
 class EnhancedSparkScraper:
     """Enhanced version of SparkScraper with advanced features"""
     
     def __init__(self):
         self.processor = IdeaProcessor()
+        # PRAW and Tweepy clients are not thread-safe, so each gets a single worker thread:
+        # the sources overlap with each other, but no client is shared between threads
+        self.reddit_executor = ThreadPoolExecutor(max_workers=1)
+        self.twitter_executor = ThreadPoolExecutor(max_workers=1)
+        self.cache = ResultCache(SparkScraperConfig.CACHE_DIR, SparkScraperConfig.CACHE_TTL)
         self.setup_apis()
     
     def setup_apis(self):
         """Setup API connections"""
+        import praw
+        import tweepy
+        
         try:
             # Reddit setup
             self.reddit = praw.Reddit(
@@ -150,152 +333,287 @@ class EnhancedSparkScraper:
             logger.warning(f"Twitter API setup failed: {e}")
             self.twitter_api = None
     
-    def scrape_reddit_enhanced(self, subreddits: List[str], keywords: List[str]) -> List[Dict[str, Any]]:
-        """Enhanced Reddit scraping with multiple subreddits and keywords"""
+    @retry_throttled
+    def _search_reddit(self, subreddit_name: str, keyword: str) -> List[Tuple[str, str]]:
+        """Search a single subreddit for a single keyword (blocking)"""
+        subreddit = self.reddit.subreddit(subreddit_name)
+        # Let Reddit drop non-matching titles server-side instead of downloading them
+        query = f"({keyword}) AND (title:project OR title:idea)"
+        ideas = []
+        for submission in subreddit.search(query, syntax="lucene", limit=SparkScraperConfig.MAX_REDDIT_POSTS):
+            if _KEYWORD_RE.search(submission.title):
+                ideas.append((submission.id, submission.title))
+        return ideas
+    
+    async def _scrape_reddit_one(self, subreddit_name: str, keyword: str, sem: asyncio.Semaphore, 
+                                 bucket: TokenBucket) -> List[Tuple[str, str]]:
+        """Run one Reddit search in the thread pool, bounded by the semaphore"""
+        cached = self.cache.get("reddit", subreddit_name, keyword)
+        if cached is not None:
+            return cached
+        
+        async with sem:
+            await bucket.acquire()
+            logger.info(f"Scraping r/{subreddit_name} for '{keyword}'")
+            loop = asyncio.get_running_loop()
+            ideas = await loop.run_in_executor(self.reddit_executor, self._search_reddit, subreddit_name, keyword)
+        
+        self.cache.set(ideas, "reddit", subreddit_name, keyword)
+        return ideas
+    
+    async def scrape_reddit_async(self, subreddits: List[str], keywords: List[str]) -> List[Dict[str, Any]]:
+        """Scrape every subreddit/keyword pair concurrently"""
         if not self.reddit:
             logger.warning("Reddit API not available")
             return []
         
-        all_ideas = []
+        sem = asyncio.Semaphore(SparkScraperConfig.MAX_CONCURRENT_REQUESTS)
+        bucket = TokenBucket.for_mode(SparkScraperConfig.RATE_LIMIT_MODE)
+        pairs = [(subreddit_name, keyword) for subreddit_name in subreddits for keyword in keywords]
+        tasks = [asyncio.create_task(self._scrape_reddit_one(s, k, sem, bucket)) for s, k in pairs]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for subreddit_name in subreddits:
-            try:
-                subreddit = self.reddit.subreddit(subreddit_name)
-                logger.info(f"Scraping r/{subreddit_name}")
-                
-                for keyword in keywords:
-                    try:
-                        for submission in subreddit.search(keyword, limit=SparkScraperConfig.MAX_REDDIT_POSTS):
-                            if "project" in submission.title.lower() or "idea" in submission.title.lower():
-                                all_ideas.append(submission.title)
-                        
-                        time.sleep(SparkScraperConfig.RATE_LIMIT_DELAY)
-                    except Exception as e:
-                        logger.error(f"Error scraping keyword '{keyword}' from r/{subreddit_name}: {e}")
-                        
-            except Exception as e:
-                logger.error(f"Error accessing subreddit r/{subreddit_name}: {e}")
+        all_ideas: List[str] = []
+        seen_submissions = set()
+        for (subreddit_name, keyword), result in zip(pairs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error scraping keyword '{keyword}' from r/{subreddit_name}: {result}")
+                continue
+            # The same submission often matches several keywords
+            for submission_id, title in result:
+                if submission_id not in seen_submissions:
+                    seen_submissions.add(submission_id)
+                    all_ideas.append(title)
         
         return self.processor.process_ideas(all_ideas, "reddit")
     
-    def scrape_twitter_enhanced(self, keywords: List[str]) -> List[Dict[str, Any]]:
-        """Enhanced Twitter scraping with multiple keywords"""
+    def scrape_reddit_enhanced(self, subreddits: List[str], keywords: List[str]) -> List[Dict[str, Any]]:
+        """Enhanced Reddit scraping with multiple subreddits and keywords"""
+        return asyncio.run(self.scrape_reddit_async(subreddits, keywords))
+    
+    @retry_throttled
+    def _search_twitter(self, keyword: str) -> List[str]:
+        """Search Twitter for a single keyword (blocking)"""
+        tweets = self.twitter_api.search_tweets(
+            q=keyword, 
+            count=SparkScraperConfig.MAX_TWITTER_TWEETS, 
+            tweet_mode="extended"
+        )
+        ideas = []
+        for tweet in tweets:
+            text = tweet.full_text
+            if _KEYWORD_RE.search(text):
+                ideas.append(text)
+        return ideas
+    
+    async def _scrape_twitter_one(self, keyword: str, sem: asyncio.Semaphore, 
+                                  bucket: TokenBucket) -> List[str]:
+        """Run one Twitter search in the thread pool, bounded by the semaphore"""
+        cached = self.cache.get("twitter", keyword)
+        if cached is not None:
+            return cached
+        
+        async with sem:
+            await bucket.acquire()
+            logger.info(f"Scraping Twitter for '{keyword}'")
+            loop = asyncio.get_running_loop()
+            ideas = await loop.run_in_executor(self.twitter_executor, self._search_twitter, keyword)
+        
+        self.cache.set(ideas, "twitter", keyword)
+        return ideas
+    
+    async def scrape_twitter_async(self, keywords: List[str]) -> List[Dict[str, Any]]:
+        """Scrape every keyword on Twitter concurrently"""
         if not self.twitter_api:
             logger.warning("Twitter API not available")
             return []
         
-        all_ideas = []
+        sem = asyncio.Semaphore(SparkScraperConfig.MAX_CONCURRENT_REQUESTS)
+        bucket = TokenBucket.for_mode(SparkScraperConfig.RATE_LIMIT_MODE)
+        tasks = [asyncio.create_task(self._scrape_twitter_one(k, sem, bucket)) for k in keywords]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        for keyword in keywords:
-            try:
-                logger.info(f"Scraping Twitter for '{keyword}'")
-                tweets = self.twitter_api.search_tweets(
-                    q=keyword, 
-                    count=SparkScraperConfig.MAX_TWITTER_TWEETS, 
-                    tweet_mode="extended"
-                )
-                
-                for tweet in tweets:
-                    text = tweet.full_text
-                    if "project" in text.lower() or "idea" in text.lower():
-                        all_ideas.append(text)
-                
-                time.sleep(SparkScraperConfig.RATE_LIMIT_DELAY)
-            except Exception as e:
-                logger.error(f"Error scraping Twitter for keyword '{keyword}': {e}")
+        all_ideas: List[str] = []
+        for keyword, result in zip(keywords, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error scraping Twitter for keyword '{keyword}': {result}")
+                continue
+            all_ideas.extend(result)
         
         return self.processor.process_ideas(all_ideas, "twitter")
     
-    def scrape_linkedin_enhanced(self, keywords: List[str]) -> List[Dict[str, Any]]:
-        """Enhanced LinkedIn scraping (use with caution)"""
-        all_ideas = []
+    def scrape_twitter_enhanced(self, keywords: List[str]) -> List[Dict[str, Any]]:
+        """Enhanced Twitter scraping with multiple keywords"""
+        return asyncio.run(self.scrape_twitter_async(keywords))
+    
+    @retry_throttled
+    async def _fetch_linkedin(self, session: aiohttp.ClientSession, url: str) -> str:
+        """GET a LinkedIn page, retrying throttled/unavailable responses with backoff"""
+        max_bytes = SparkScraperConfig.MAX_RESPONSE_BYTES
         
-        for keyword in keywords:
-            try:
-                logger.info(f"Scraping LinkedIn for '{keyword}'")
-                url = f"https://www.linkedin.com/search/results/content/?keywords={keyword}"
-                headers = {"User-Agent": SparkScraperConfig.USER_AGENT}
-                
-                response = requests.get(url, headers=headers, timeout=10)
-                soup = BeautifulSoup(response.text, "html.parser")
-                
-                # Try multiple selectors for LinkedIn content
-                selectors = [
-                    "div.search-result__info",
-                    "div.feed-shared-text",
-                    "span.break-words"
-                ]
-                
-                for selector in selectors:
-                    posts = soup.find_all("div", class_=selector.split(".")[1])
-                    for post in posts:
-                        text = post.get_text().strip()
-                        if "project" in text.lower() or "idea" in text.lower():
-                            all_ideas.append(text)
-                
-                time.sleep(SparkScraperConfig.RATE_LIMIT_DELAY)
-            except Exception as e:
-                logger.error(f"Error scraping LinkedIn for keyword '{keyword}': {e}")
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status in SparkScraperConfig.RETRY_STATUS_CODES:
+                response.raise_for_status()
+            
+            # Bound memory no matter what the server sends
+            if (response.content_length or 0) > max_bytes:
+                logger.warning(f"Skipping {url}: {response.content_length} bytes exceeds {max_bytes}")
+                return ""
+            
+            chunks = []
+            total = 0
+            async for chunk in response.content.iter_chunked(65536):
+                total += len(chunk)
+                if total > max_bytes:
+                    logger.warning(f"Truncating {url} at {max_bytes} bytes")
+                    break
+                chunks.append(chunk)
+            
+            return b"".join(chunks).decode(response.charset or "utf-8", "replace")
+    
+    async def _scrape_linkedin_one(self, session: aiohttp.ClientSession, keyword: str, 
+                                   sem: asyncio.Semaphore, bucket: TokenBucket) -> List[str]:
+        """Fetch and parse one LinkedIn search page, bounded by the semaphore"""
+        cached = self.cache.get("linkedin", keyword)
+        if cached is not None:
+            return cached
+        
+        async with sem:
+            await bucket.acquire()
+            logger.info(f"Scraping LinkedIn for '{keyword}'")
+            url = f"https://www.linkedin.com/search/results/content/?keywords={keyword}"
+            html = await self._fetch_linkedin(session, url)
+        
+        tree = LexborHTMLParser(html)
+        
+        # Try multiple selectors for LinkedIn content in a single DOM walk
+        selectors = [
+            "div.search-result__info",
+            "div.feed-shared-text",
+            "span.break-words"
+        ]
+        
+        ideas = []
+        for post in tree.css(", ".join(selectors)):
+            text = post.text().strip()
+            if _KEYWORD_RE.search(text):
+                ideas.append(text)
+        
+        self.cache.set(ideas, "linkedin", keyword)
+        return ideas
+    
+    @asynccontextmanager
+    async def http_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Pooled keep-alive session shared by every request made in one event loop"""
+        connector = aiohttp.TCPConnector(
+            limit=SparkScraperConfig.CONNECTION_POOL_SIZE,
+            limit_per_host=SparkScraperConfig.MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=SparkScraperConfig.DNS_CACHE_TTL,
+            keepalive_timeout=SparkScraperConfig.KEEPALIVE_TIMEOUT
+        )
+        headers = {"User-Agent": SparkScraperConfig.USER_AGENT}
+        
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            yield session
+    
+    async def scrape_linkedin_async(self, keywords: List[str], 
+                                    session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
+        """Scrape every keyword on LinkedIn concurrently over one shared session"""
+        if session is None:
+            async with self.http_session() as session:
+                return await self.scrape_linkedin_async(keywords, session)
+        
+        sem = asyncio.Semaphore(SparkScraperConfig.MAX_CONCURRENT_REQUESTS)
+        bucket = TokenBucket.for_mode(SparkScraperConfig.RATE_LIMIT_MODE)
+        tasks = [asyncio.create_task(self._scrape_linkedin_one(session, k, sem, bucket)) for k in keywords]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        all_ideas: List[str] = []
+        for keyword, result in zip(keywords, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error scraping LinkedIn for keyword '{keyword}': {result}")
+                continue
+            all_ideas.extend(result)
         
         return self.processor.process_ideas(all_ideas, "linkedin")
     
-    def generate_markdown_enhanced(self, ideas: List[Dict[str, Any]]) -> str:
-        """Generate enhanced markdown with categories and sentiment"""
-        markdown = "# SparkScraper Project Ideas\n\n"
-        markdown += f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        markdown += f"Total ideas found: {len(ideas)}\n\n"
+    def scrape_linkedin_enhanced(self, keywords: List[str]) -> List[Dict[str, Any]]:
+        """Enhanced LinkedIn scraping (use with caution)"""
+        return asyncio.run(self.scrape_linkedin_async(keywords))
+    
+    @classmethod
+    def _markdown_parts(cls, ideas: List[Dict[str, Any]]) -> List[str]:
+        """Build the enhanced markdown document as a list of string fragments"""
+        parts = [
+            "# SparkScraper Project Ideas\n\n",
+            f"Generated on: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC\n\n",
+            f"Total ideas found: {len(ideas)}\n\n"
+        ]
         
-        # Group by source
-        by_source = {}
+        # Group by source, then by category, in a single pass
+        buckets: Dict[str, Dict[str, List[Dict[str, Any]]]] = defaultdict(lambda: defaultdict(list))
         for idea in ideas:
-            source = idea["source"]
-            if source not in by_source:
-                by_source[source] = []
-            by_source[source].append(idea)
+            for category in idea["categories"]:
+                buckets[idea["source"]][category].append(idea)
         
-        for source, source_ideas in by_source.items():
-            markdown += f"## From {source.title()}\n\n"
-            
-            # Group by category
-            by_category = {}
-            for idea in source_ideas:
-                for category in idea["categories"]:
-                    if category not in by_category:
-                        by_category[category] = []
-                    by_category[category].append(idea)
+        for source, by_category in buckets.items():
+            parts.append(f"## From {source.title()}\n\n")
             
             for category, category_ideas in by_category.items():
-                markdown += f"### {category.replace('_', ' ').title()}\n\n"
+                parts.append(f"### {category.replace('_', ' ').title()}\n\n")
                 
                 for i, idea in enumerate(category_ideas, 1):
                     sentiment_emoji = "😊" if idea["sentiment"] > 0 else "😐" if idea["sentiment"] == 0 else "😔"
-                    markdown += f"{i}. {idea['text']} {sentiment_emoji}\n"
+                    parts.append(f"{i}. {idea['text']} {sentiment_emoji}\n")
                 
-                markdown += "\n"
+                parts.append("\n")
         
-        return markdown
+        return parts
     
-    def generate_json(self, ideas: List[Dict[str, Any]]) -> str:
-        """Generate JSON output"""
-        output = {
+    @classmethod
+    def generate_markdown_enhanced(cls, ideas: List[Dict[str, Any]]) -> str:
+        """Generate enhanced markdown with categories and sentiment"""
+        return "".join(cls._markdown_parts(ideas))
+    
+    @classmethod
+    def _json_document(cls, ideas: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the JSON output document"""
+        return {
             "metadata": {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": datetime.now(timezone.utc).isoformat(),
                 "total_ideas": len(ideas),
                 "sources": list(set(idea["source"] for idea in ideas)),
                 "categories": list(set(cat for idea in ideas for cat in idea["categories"]))
             },
             "ideas": ideas
         }
-        return json.dumps(output, indent=2)
     
-    def generate_csv(self, ideas: List[Dict[str, Any]]) -> str:
-        """Generate CSV output"""
+    @classmethod
+    def _json_bytes(cls, ideas: List[Dict[str, Any]]) -> bytes:
+        """Serialize the JSON output document to UTF-8 bytes"""
+        option = orjson.OPT_NON_STR_KEYS
+        if SparkScraperConfig.PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(cls._json_document(ideas), option=option)
+    
+    @classmethod
+    def generate_json(cls, ideas: List[Dict[str, Any]]) -> str:
+        """Generate JSON output"""
+        return cls._json_bytes(ideas).decode()
+    
+    @classmethod
+    def _write_json(cls, f: BinaryIO, ideas: List[Dict[str, Any]]):
+        """Write JSON output to a file opened in binary mode"""
+        f.write(cls._json_bytes(ideas))
+    
+    @classmethod
+    def _write_csv(cls, f: TextIO, ideas: List[Dict[str, Any]]):
+        """Stream CSV output to an open file, one row at a time"""
         if not ideas:
-            return ""
+            return
         
-        output = StringIO()
         fieldnames = ["text", "source", "categories", "sentiment", "word_count", "timestamp"]
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
         
         writer.writeheader()
         for idea in ideas:
@@ -303,35 +621,65 @@ class EnhancedSparkScraper:
             idea_copy = idea.copy()
             idea_copy["categories"] = ", ".join(idea["categories"])
             writer.writerow(idea_copy)
-        
+    
+    @classmethod
+    def generate_csv(cls, ideas: List[Dict[str, Any]]) -> str:
+        """Generate CSV output"""
+        output = StringIO()
+        cls._write_csv(output, ideas)
         return output.getvalue()
     
+    @classmethod
+    def _write_markdown(cls, f: TextIO, ideas: List[Dict[str, Any]]):
+        """Write markdown output to an open file"""
+        f.writelines(cls._markdown_parts(ideas))
+    
     def save_output(self, ideas: List[Dict[str, Any]], formats: List[str] = None):
         """Save output in multiple formats"""
         if formats is None:
             formats = ["markdown"]
         
+        # (filename, opened in binary mode, writer) per format; orjson already
+        # produces UTF-8 bytes, so JSON skips the decode/encode round trip
+        writers: Dict[str, Tuple[str, bool, Callable[[Any, List[Dict[str, Any]]], None]]] = {
+            "markdown": (SparkScraperConfig.OUTPUT_FILENAME, False, self._write_markdown),
+            "json": ("sparkscraper_ideas.json", True, self._write_json),
+            "csv": ("sparkscraper_ideas.csv", False, self._write_csv)
+        }
+        
+        f: IO[Any]
         for output_format in formats:
-            if output_format == "markdown":
-                content = self.generate_markdown_enhanced(ideas)
-                filename = SparkScraperConfig.OUTPUT_FILENAME
-            elif output_format == "json":
-                content = self.generate_json(ideas)
-                filename = "sparkscraper_ideas.json"
-            elif output_format == "csv":
-                content = self.generate_csv(ideas)
-                filename = "sparkscraper_ideas.csv"
-            else:
+            if output_format not in writers:
                 logger.warning(f"Unknown output format: {output_format}")
                 continue
             
+            filename, binary, write = writers[output_format]
             try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                if binary:
+                    f = open(filename, 'wb')
+                else:
+                    f = open(filename, 'w', encoding='utf-8', newline='')
+                with f:
+                    write(f, ideas)
                 logger.info(f"Output saved to {filename}")
             except Exception as e:
                 logger.error(f"Error saving {filename}: {e}")
     
+    async def _run_async(self, keywords: List[str], subreddits: List[str]) -> List[Dict[str, Any]]:
+        """Scrape all sources concurrently"""
+        async with self.http_session() as session:
+            reddit_ideas, twitter_ideas, linkedin_ideas = await asyncio.gather(
+                self.scrape_reddit_async(subreddits, keywords),
+                self.scrape_twitter_async(keywords),
+                self.scrape_linkedin_async(keywords, session)
+            )
+        return reddit_ideas + twitter_ideas + linkedin_ideas
+    
+    def scrape_all(self, keywords: List[str], subreddits: List[str]) -> List[Dict[str, Any]]:
+        """Scrape all sources and return the processed ideas, without saving them"""
+        self.processor.reset()
+        return asyncio.run(self._run_async(keywords, subreddits))
+    
     def run(self, keywords: List[str] = None, subreddits: List[str] = None, 
             output_formats: List[str] = None):
         """Run the enhanced scraper"""
@@ -346,18 +694,10 @@ class EnhancedSparkScraper:
         logger.info(f"Keywords: {keywords}")
         logger.info(f"Subreddits: {subreddits}")
         
-        all_ideas = []
-        
-        # Scrape from all sources
-        reddit_ideas = self.scrape_reddit_enhanced(subreddits, keywords)
-        twitter_ideas = self.scrape_twitter_enhanced(keywords)
-        linkedin_ideas = self.scrape_linkedin_enhanced(keywords)
-        
-        all_ideas.extend(reddit_ideas)
-        all_ideas.extend(twitter_ideas)
-        all_ideas.extend(linkedin_ideas)
+        all_ideas = self.scrape_all(keywords, subreddits)
         
         logger.info(f"Total ideas collected: {len(all_ideas)}")
+        self.processor.save_seen_ideas()
         
         # Save output
         self.save_output(all_ideas, output_formats)
@@ -1,22 +1,39 @@
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import tempfile
-import os
+from unittest.mock import patch, AsyncMock
+import asyncio
 import sys
+import threading
+import time
+from concurrent.futures import Future
 from io import StringIO
+from types import SimpleNamespace as NS
+import aiohttp
+from aiohttp_client_cache import CacheBackend
 
 # Import the functions we want to test
 from sparkscraper import (
     scrape_reddit, 
     scrape_twitter, 
     scrape_linkedin, 
-    generate_markdown
+    generate_markdown,
+    NEGATIVE_CACHE,
+    NEGATIVE_CACHE_TTL,
+    _KEYWORD_RE
 )
+from sparkscraper_enhanced import EnhancedSparkScraper, IdeaProcessor, TokenBucket, _is_throttled, retry_throttled
+from config import SparkScraperConfig, RateLimitMode
+
+def _without_timestamps(records):
+    """Drop the per-call timestamp so records from separate runs compare equal."""
+    return [{k: v for k, v in r.items() if k != "timestamp"} for r in records]
 
 class TestSparkScraper(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures before each test method."""
+        # Dead LinkedIn pages are remembered module-wide; start each test clean
+        NEGATIVE_CACHE.clear()
+        
         self.test_reddit_ideas = [
             "Build a weather app with real-time alerts",
             "Create a project management tool for freelancers",
@@ -38,16 +55,12 @@ class TestSparkScraper(unittest.TestCase):
     def test_scrape_reddit_mock(self):
         """Test Reddit scraping with mock data."""
         with patch('sparkscraper.reddit') as mock_reddit:
-            # Mock the subreddit and search results
-            mock_subreddit = Mock()
-            mock_submission1 = Mock()
-            mock_submission1.title = "Build a weather app with real-time alerts"
-            mock_submission2 = Mock()
-            mock_submission2.title = "Random post about cats"
-            mock_submission3 = Mock()
-            mock_submission3.title = "Project idea: AI chatbot for customer service"
-            
-            mock_subreddit.search.return_value = [mock_submission1, mock_submission2, mock_submission3]
+            # Stub the subreddit and search results
+            mock_subreddit = NS(search=lambda *args, **kwargs: [
+                NS(title="Build a weather app with real-time alerts"),
+                NS(title="Random post about cats"),
+                NS(title="Project idea: AI chatbot for customer service")
+            ])
             mock_reddit.subreddit.return_value = mock_subreddit
             
             result = scrape_reddit("sideprojects", "project ideas", limit=3)
@@ -62,15 +75,12 @@ class TestSparkScraper(unittest.TestCase):
     def test_scrape_twitter_mock(self):
         """Test Twitter scraping with mock data."""
         with patch('sparkscraper.twitter_api') as mock_api:
-            # Mock tweet objects
-            mock_tweet1 = Mock()
-            mock_tweet1.full_text = "Idea: A platform to connect indie game devs with artists"
-            mock_tweet2 = Mock()
-            mock_tweet2.full_text = "Just had coffee"
-            mock_tweet3 = Mock()
-            mock_tweet3.full_text = "Project idea: AI-powered personal finance tracker"
-            
-            mock_api.search_tweets.return_value = [mock_tweet1, mock_tweet2, mock_tweet3]
+            # Stub tweet objects
+            mock_api.search_tweets.return_value = [
+                NS(full_text="Idea: A platform to connect indie game devs with artists"),
+                NS(full_text="Just had coffee"),
+                NS(full_text="Project idea: AI-powered personal finance tracker")
+            ]
             
             result = scrape_twitter("project ideas", count=3)
             
@@ -82,17 +92,17 @@ class TestSparkScraper(unittest.TestCase):
 
     def test_scrape_linkedin_mock(self):
         """Test LinkedIn scraping with mock data."""
-        with patch('sparkscraper.requests.get') as mock_get:
+        # Keep the HTTP cache in memory so the test never touches CACHE_DIR
+        with patch('sparkscraper.http_cache', return_value=CacheBackend()), \
+             patch('sparkscraper._fetch', new_callable=AsyncMock) as mock_fetch:
             # Mock HTML response
-            mock_response = Mock()
-            mock_response.text = '''
+            mock_fetch.return_value = '''
             <html>
                 <div class="search-result__info">Develop a tool for remote team collaboration</div>
                 <div class="search-result__info">Random post about weather</div>
                 <div class="search-result__info">Project: Automated social media scheduler</div>
             </html>
             '''
-            mock_get.return_value = mock_response
             
             result = scrape_linkedin("project ideas")
             
@@ -102,54 +112,56 @@ class TestSparkScraper(unittest.TestCase):
             ]
             self.assertEqual(result, expected)
 
-    def test_generate_markdown(self):
-        """Test markdown generation with temporary file."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as temp_file:
-            temp_filename = temp_file.name
-        
-        try:
-            generate_markdown(self.test_reddit_ideas, self.test_twitter_ideas, self.test_linkedin_ideas)
+    def test_linkedin_negative_cache(self):
+        """Empty LinkedIn pages are not refetched until NEGATIVE_CACHE_TTL has passed."""
+        with patch('sparkscraper.http_cache', return_value=CacheBackend()), \
+             patch('sparkscraper._fetch', new_callable=AsyncMock) as mock_fetch, \
+             patch('sparkscraper.time') as mock_time:
+            mock_fetch.return_value = "<html><div>No results</div></html>"
+            mock_time.time.return_value = 1000.0
             
-            # Read the generated file
-            with open("sparkscraper_ideas.md", 'r') as f:
-                content = f.read()
+            self.assertEqual(scrape_linkedin("dead keyword"), [])
+            self.assertEqual(mock_fetch.await_count, 1)
             
-            # Check if all sections are present
-            self.assertIn("# SparkScraper Project Ideas", content)
-            self.assertIn("## From Reddit", content)
-            self.assertIn("## From Twitter/X", content)
-            self.assertIn("## From LinkedIn", content)
+            # Still within the TTL: the page is skipped without a request
+            mock_time.time.return_value = 1000.0 + NEGATIVE_CACHE_TTL - 1
+            self.assertEqual(scrape_linkedin("dead keyword"), [])
+            self.assertEqual(mock_fetch.await_count, 1)
             
-            # Check if ideas are included
-            self.assertIn("Build a weather app with real-time alerts", content)
-            self.assertIn("Idea: A platform to connect indie game devs with artists", content)
-            self.assertIn("Develop a tool for remote team collaboration", content)
-            
-        finally:
-            # Clean up
-            if os.path.exists("sparkscraper_ideas.md"):
-                os.remove("sparkscraper_ideas.md")
+            # Expired: the page is fetched again and the stale entry replaced
+            mock_time.time.return_value = 1000.0 + NEGATIVE_CACHE_TTL + 1
+            self.assertEqual(scrape_linkedin("dead keyword"), [])
+            self.assertEqual(mock_fetch.await_count, 2)
+            self.assertEqual(list(NEGATIVE_CACHE.values()), [1000.0 + 2 * NEGATIVE_CACHE_TTL + 1])
+
+    def test_generate_markdown(self):
+        """Test markdown generation into an in-memory buffer."""
+        buf = StringIO()
+        generate_markdown(self.test_reddit_ideas, self.test_twitter_ideas, self.test_linkedin_ideas, out=buf)
+        content = buf.getvalue()
+        
+        # Check if all sections are present
+        self.assertIn("# SparkScraper Project Ideas", content)
+        self.assertIn("## From Reddit", content)
+        self.assertIn("## From Twitter/X", content)
+        self.assertIn("## From LinkedIn", content)
+        
+        # Check if ideas are included
+        self.assertIn("Build a weather app with real-time alerts", content)
+        self.assertIn("Idea: A platform to connect indie game devs with artists", content)
+        self.assertIn("Develop a tool for remote team collaboration", content)
 
     def test_empty_results(self):
         """Test handling of empty results."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.md') as temp_file:
-            temp_filename = temp_file.name
+        buf = StringIO()
+        generate_markdown([], [], [], out=buf)
+        content = buf.getvalue()
         
-        try:
-            generate_markdown([], [], [])
-            
-            with open("sparkscraper_ideas.md", 'r') as f:
-                content = f.read()
-            
-            # Should still generate the header
-            self.assertIn("# SparkScraper Project Ideas", content)
-            self.assertIn("## From Reddit", content)
-            self.assertIn("## From Twitter/X", content)
-            self.assertIn("## From LinkedIn", content)
-            
-        finally:
-            if os.path.exists("sparkscraper_ideas.md"):
-                os.remove("sparkscraper_ideas.md")
+        # Should still generate the header
+        self.assertIn("# SparkScraper Project Ideas", content)
+        self.assertIn("## From Reddit", content)
+        self.assertIn("## From Twitter/X", content)
+        self.assertIn("## From LinkedIn", content)
 
     def test_keyword_filtering(self):
         """Test that only relevant posts are filtered."""
@@ -163,8 +175,7 @@ class TestSparkScraper(unittest.TestCase):
         ]
         
         # Simulate the filtering logic
-        filtered = [post for post in test_posts 
-                   if "project" in post.lower() or "idea" in post.lower()]
+        filtered = [post for post in test_posts if _KEYWORD_RE.search(post)]
         
         expected = [
             "Build a weather app with real-time alerts",
@@ -174,5 +185,201 @@ class TestSparkScraper(unittest.TestCase):
         
         self.assertEqual(filtered, expected)
 
+class TestIdeaProcessor(unittest.TestCase):
+    
+    def test_vectorized_matches_row_path(self):
+        """Large batches take the pandas path; it must produce the same records."""
+        ideas = []
+        for i in range(40):
+            ideas.append(f"Project idea {i}: build a fitness tracker app for remote teams")
+            ideas.append(f"Idea {i} see https://example.com/{i} for a blockchain wallet")
+        ideas += [
+            "Project idea: build a fitness tracker app for remote teams",
+            "PROJECT IDEA: BUILD A FITNESS TRACKER APP FOR REMOTE TEAMS",  # duplicate
+            "Idea: buy now and get a discount on this great project",      # excluded words
+            "Idea: tiny app",                                              # too short
+            "Project!!! *** a   weather    app with ### alerts for hikers",
+            ""
+        ]
+        self.assertGreaterEqual(len(ideas), IdeaProcessor.VECTORIZE_MIN_BATCH)
+        
+        vectorized = IdeaProcessor()._process_ideas_vec(ideas, "reddit")
+        row = list(IdeaProcessor().process_ideas_batched((idea, "reddit") for idea in ideas))
+        
+        self.assertEqual(_without_timestamps(vectorized), _without_timestamps(row))
+        self.assertEqual(len(row), 82)
+
+class TestRateLimiting(unittest.TestCase):
+    
+    def acquire_times(self, bucket_mode, count):
+        """Times at which `count` back-to-back acquires succeed, on a fake clock."""
+        clock = [0.0]
+        
+        async def fake_sleep(delay):
+            clock[0] += delay
+        
+        async def run():
+            bucket = TokenBucket.for_mode(bucket_mode)
+            times = []
+            for _ in range(count):
+                await bucket.acquire()
+                times.append(clock[0])
+            return times
+        
+        with patch('sparkscraper_enhanced.time') as mock_time, \
+             patch.object(asyncio, 'sleep', side_effect=fake_sleep):
+            mock_time.monotonic.side_effect = lambda: clock[0]
+            return asyncio.run(run())
+    
+    def test_token_bucket_spacing(self):
+        """Without a burst, requests are spaced by the mode's delay."""
+        times = self.acquire_times(RateLimitMode.FAST, 3)
+        for actual, expected in zip(times, [0.0, 0.3, 0.6]):
+            self.assertAlmostEqual(actual, expected, places=6)
+    
+    def test_token_bucket_aggressive_burst(self):
+        """AGGRESSIVE lets a full burst through at once, then paces."""
+        burst = SparkScraperConfig.MAX_CONCURRENT_REQUESTS
+        times = self.acquire_times(RateLimitMode.AGGRESSIVE, burst + 2)
+        self.assertEqual(times[:burst], [0.0] * burst)
+        self.assertAlmostEqual(times[burst], 0.1, places=6)
+        self.assertAlmostEqual(times[burst + 1], 0.2, places=6)
+    
+    def response_error(self, status):
+        return aiohttp.ClientResponseError(request_info=None, history=(), status=status)
+    
+    def test_is_throttled(self):
+        """Only rate limiting statuses count as throttling."""
+        self.assertTrue(_is_throttled(self.response_error(429)))
+        self.assertFalse(_is_throttled(self.response_error(404)))
+        self.assertFalse(_is_throttled(ValueError("bad")))
+    
+    def test_non_throttling_error_not_retried(self):
+        """Errors other than throttling propagate on the first attempt."""
+        calls = []
+        
+        @retry_throttled
+        def fetch():
+            calls.append(1)
+            raise self.response_error(404)
+        
+        with self.assertRaises(aiohttp.ClientResponseError):
+            fetch()
+        self.assertEqual(len(calls), 1)
+
+class TestLinkedInFetch(unittest.TestCase):
+    
+    def fetch(self, chunks, content_length=None):
+        """Run _fetch_linkedin against a fake response streaming `chunks`."""
+        async def iter_chunked(size):
+            for chunk in chunks:
+                yield chunk
+        
+        response = NS(status=200, content_length=content_length, charset=None,
+                      content=NS(iter_chunked=iter_chunked))
+        
+        class FakeGet:
+            async def __aenter__(self):
+                return response
+            
+            async def __aexit__(self, *exc):
+                return False
+        
+        session = NS(get=lambda url, timeout: FakeGet())
+        scraper = EnhancedSparkScraper.__new__(EnhancedSparkScraper)
+        with patch.object(SparkScraperConfig, 'MAX_RESPONSE_BYTES', 100):
+            return asyncio.run(scraper._fetch_linkedin(session, "https://example.com"))
+    
+    def test_within_limit(self):
+        self.assertEqual(self.fetch([b"a" * 40, b"b" * 40], content_length=80), "a" * 40 + "b" * 40)
+    
+    def test_content_length_over_limit_skipped(self):
+        """An oversized Content-Length is skipped without reading the body."""
+        self.assertEqual(self.fetch([b"a" * 10], content_length=1000), "")
+    
+    def test_chunked_body_truncated(self):
+        """A body without Content-Length stops at the last chunk under the cap."""
+        self.assertEqual(self.fetch([b"a" * 40] * 5), "a" * 80)
+
+class TestWebInterface(unittest.TestCase):
+    
+    def setUp(self):
+        """Use a test client and start every test with an empty job table."""
+        import web_interface
+        self.web = web_interface
+        self.client = web_interface.app.test_client()
+        self.web.JOBS.clear()
+        self.addCleanup(self.web.JOBS.clear)
+    
+    def submit(self):
+        response = self.client.post('/api/scrape', json={
+            'keywords': ['project ideas'],
+            'subreddits': ['sideprojects'],
+            'output_formats': ['json']
+        })
+        self.assertEqual(response.status_code, 202)
+        return response.get_json()['job_id']
+    
+    def wait(self, job_id):
+        _, future = self.web.JOBS[job_id]
+        try:
+            future.result(timeout=5)
+        except Exception:
+            pass
+    
+    def test_scrape_job_lifecycle(self):
+        """A job is pending, then reports its result once and is removed."""
+        release = threading.Event()
+        result = {'success': True, 'results_count': 2}
+        
+        def run_scrape(keywords, subreddits, output_formats):
+            release.wait(5)
+            return result
+        
+        with patch.object(self.web, '_run_scrape', side_effect=run_scrape):
+            job_id = self.submit()
+            
+            pending = self.client.get(f'/api/scrape/{job_id}').get_json()
+            self.assertEqual(pending, {'done': False, 'result': None})
+            
+            release.set()
+            self.wait(job_id)
+            done = self.client.get(f'/api/scrape/{job_id}').get_json()
+            self.assertEqual(done, {'done': True, 'result': result})
+        
+        self.assertNotIn(job_id, self.web.JOBS)
+        self.assertEqual(self.client.get(f'/api/scrape/{job_id}').status_code, 404)
+    
+    def test_unknown_job(self):
+        """Polling an id that was never issued is a 404."""
+        self.assertEqual(self.client.get('/api/scrape/nope').status_code, 404)
+    
+    def test_failed_job(self):
+        """A job that raised is reported as unsuccessful."""
+        with patch.object(self.web, '_run_scrape', side_effect=RuntimeError("boom")):
+            job_id = self.submit()
+            self.wait(job_id)
+            done = self.client.get(f'/api/scrape/{job_id}').get_json()
+        
+        self.assertTrue(done['done'])
+        self.assertEqual(done['result'], {'success': False, 'error': 'boom'})
+    
+    def test_abandoned_jobs_expire(self):
+        """Finished jobs older than JOB_TTL are dropped when a new job is submitted."""
+        stale, fresh = Future(), Future()
+        stale.set_result({'success': True})
+        fresh.set_result({'success': True})
+        now = time.monotonic()
+        self.web.JOBS['stale'] = (now - self.web.JOB_TTL - 1, stale)
+        self.web.JOBS['fresh'] = (now, fresh)
+        
+        with patch.object(self.web, '_run_scrape', return_value={'success': True}):
+            job_id = self.submit()
+            self.wait(job_id)
+        
+        self.assertNotIn('stale', self.web.JOBS)
+        self.assertIn('fresh', self.web.JOBS)
+        self.assertIn(job_id, self.web.JOBS)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
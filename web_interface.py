@@ -3,17 +3,72 @@ Web Interface for SparkScraper
 Simple Flask-based web interface for running the scraper
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
+from werkzeug.exceptions import NotFound
+import orjson
 import os
 import json
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from sparkscraper_enhanced import EnhancedSparkScraper
+from functools import lru_cache
+from itertools import chain, repeat
+from typing import Any, Dict, List, Tuple
+from sparkscraper_enhanced import EnhancedSparkScraper, IdeaProcessor
 from config import SparkScraperConfig
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Configuration only changes on restart, so serialize it once
+_CONFIG_BLOB = orjson.dumps({
+    'validation': SparkScraperConfig.validate_config(),
+    'default_keywords': SparkScraperConfig.DEFAULT_KEYWORDS,
+    'default_subreddits': SparkScraperConfig.DEFAULT_SUBREDDITS,
+    'output_formats': SparkScraperConfig.OUTPUT_FORMATS
+})
+
+# Background scrape jobs, keyed by job id, with their submission time.
+# Scrapes are serialized by _scrape_lock anyway, so one worker is enough.
+EXECUTOR = ThreadPoolExecutor(max_workers=1)
+JOBS: Dict[str, Tuple[float, Future]] = {}
+JOB_TTL = 3600  # seconds a finished job is kept for polling
 
-# Global scraper instance
-scraper = None
+def _expire_jobs():
+    """Forget finished jobs whose result was never collected"""
+    cutoff = time.monotonic() - JOB_TTL
+    for job_id, (submitted, future) in list(JOBS.items()):
+        if future.done() and submitted < cutoff:
+            JOBS.pop(job_id, None)
+
+# Downloadable output files; the scrape page links by output format name
+DOWNLOAD_FILES = {
+    'md': SparkScraperConfig.OUTPUT_FILENAME,
+    'markdown': SparkScraperConfig.OUTPUT_FILENAME,
+    'json': 'sparkscraper_ideas.json',
+    'csv': 'sparkscraper_ideas.csv'
+}
+
+# The scraper and its output files are shared, so scrapes run one at a time
+_scrape_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def get_scraper() -> EnhancedSparkScraper:
+    """Shared scraper instance, built on first use"""
+    return EnhancedSparkScraper()
 
 @app.route('/')
 def index():
@@ -23,37 +78,44 @@ def index():
 @app.route('/api/config')
 def get_config():
     """Get current configuration"""
-    validation = SparkScraperConfig.validate_config()
-    return jsonify({
-        'validation': validation,
-        'default_keywords': SparkScraperConfig.DEFAULT_KEYWORDS,
-        'default_subreddits': SparkScraperConfig.DEFAULT_SUBREDDITS,
-        'output_formats': SparkScraperConfig.OUTPUT_FORMATS
-    })
+    response = Response(_CONFIG_BLOB, mimetype='application/json')
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
+
+def _run_scrape(keywords: List[str], subreddits: List[str], 
+                output_formats: List[str]) -> Dict[str, Any]:
+    """Scrape and save output; runs on the background executor"""
+    with _scrape_lock:
+        # Repeat requests are served from the scraper's on-disk result cache
+        scraper = get_scraper()
+        results = scraper.scrape_all(keywords, subreddits)
+        scraper.processor.save_seen_ideas()
+        scraper.save_output(results, output_formats)
+    
+    return {
+        'success': True,
+        'message': f'Successfully scraped {len(results)} ideas',
+        'results_count': len(results),
+        'output_files': [fmt for fmt in output_formats]
+    }
 
 @app.route('/api/scrape', methods=['POST'])
 def scrape():
-    """Run the scraper"""
-    global scraper
-    
+    """Queue a scrape and return its job id"""
     try:
         data = request.get_json()
         keywords = data.get('keywords', SparkScraperConfig.get_keywords())
         subreddits = data.get('subreddits', SparkScraperConfig.get_subreddits())
         output_formats = data.get('output_formats', ['markdown'])
         
-        # Initialize scraper
-        scraper = EnhancedSparkScraper()
-        
-        # Run scraping
-        results = scraper.run(keywords, subreddits, output_formats)
+        _expire_jobs()
+        job_id = uuid.uuid4().hex
+        JOBS[job_id] = (time.monotonic(), EXECUTOR.submit(_run_scrape, keywords, subreddits, output_formats))
         
         return jsonify({
             'success': True,
-            'message': f'Successfully scraped {len(results)} ideas',
-            'results_count': len(results),
-            'output_files': [fmt for fmt in output_formats]
-        })
+            'job_id': job_id
+        }), 202
         
     except Exception as e:
         return jsonify({
@@ -61,43 +123,79 @@ def scrape():
             'error': str(e)
         }), 500
 
+@app.route('/api/scrape/<job_id>')
+def scrape_status(job_id):
+    """Poll a queued scrape; finished jobs are dropped once reported"""
+    job = JOBS.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    _, future = job
+    
+    if not future.done():
+        return jsonify({'done': False, 'result': None})
+    
+    JOBS.pop(job_id, None)
+    try:
+        result = future.result()
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    
+    return jsonify({'done': True, 'result': result})
+
 @app.route('/api/download/<format>')
 def download_file(format):
     """Download generated files"""
-    filename = f"sparkscraper_ideas.{format}"
+    filename = DOWNLOAD_FILES.get(format)
+    if filename is None:
+        return jsonify({'error': 'File not found'}), 404
     
-    if not os.path.exists(filename):
+    # Output is written to the working directory, not the app root
+    try:
+        return send_from_directory(os.getcwd(), filename, as_attachment=True, 
+                                   conditional=True, max_age=0)
+    except (FileNotFoundError, NotFound):
         return jsonify({'error': 'File not found'}), 404
+
+SAMPLE_MIMETYPES = {
+    'md': 'text/markdown',
+    'json': 'application/json',
+    'csv': 'text/csv'
+}
+
+@lru_cache(maxsize=1)
+def _sample_outputs() -> Dict[str, bytes]:
+    """Sample output in every format; the fixtures never change, so build it once"""
+    from test_sparkscraper import TestSparkScraper
+    
+    # Create test instance
+    test_instance = TestSparkScraper()
+    test_instance.setUp()
     
-    return send_file(filename, as_attachment=True)
+    # A private processor keeps the sample out of the shared duplicate filter
+    all_ideas = list(IdeaProcessor().process_ideas_batched(chain(
+        zip(test_instance.test_reddit_ideas, repeat("reddit")),
+        zip(test_instance.test_twitter_ideas, repeat("twitter")),
+        zip(test_instance.test_linkedin_ideas, repeat("linkedin"))
+    )))
+    
+    # The formatters are classmethods, so no scraper (or API client) is built here
+    return {
+        'md': EnhancedSparkScraper.generate_markdown_enhanced(all_ideas).encode('utf-8'),
+        'json': EnhancedSparkScraper._json_bytes(all_ideas),
+        'csv': EnhancedSparkScraper.generate_csv(all_ideas).encode('utf-8')
+    }
 
 @app.route('/api/sample')
 def generate_sample():
     """Generate sample output"""
-    global scraper
-    
     try:
-        from test_sparkscraper import TestSparkScraper
-        
-        # Create test instance
-        test_instance = TestSparkScraper()
-        test_instance.setUp()
-        
-        # Create scraper and process sample data
-        scraper = EnhancedSparkScraper()
-        all_ideas = (
-            scraper.processor.process_ideas(test_instance.test_reddit_ideas, "reddit") +
-            scraper.processor.process_ideas(test_instance.test_twitter_ideas, "twitter") +
-            scraper.processor.process_ideas(test_instance.test_linkedin_ideas, "linkedin")
-        )
-        
-        # Save in all formats
-        scraper.save_output(all_ideas, ['markdown', 'json', 'csv'])
+        _sample_outputs()
         
         return jsonify({
             'success': True,
-            'message': 'Sample files generated successfully',
-            'files': ['sparkscraper_ideas.md', 'sparkscraper_ideas.json', 'sparkscraper_ideas.csv']
+            'message': 'Sample output is ready to download',
+            'formats': list(SAMPLE_MIMETYPES)
         })
         
     except Exception as e:
@@ -106,301 +204,18 @@ def generate_sample():
             'error': str(e)
         }), 500
 
-if __name__ == '__main__':
-    # Create templates directory if it doesn't exist
-    os.makedirs('templates', exist_ok=True)
+@app.route('/api/sample/<format>')
+def download_sample(format):
+    """Download sample output straight from memory"""
+    if format not in SAMPLE_MIMETYPES:
+        return jsonify({'error': 'File not found'}), 404
     
-    # Create basic HTML template
-    html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SparkScraper Web Interface</title>
-    <style>
-        body {
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }
-        h1 {
-            color: #2c3e50;
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .form-group {
-            margin-bottom: 20px;
-        }
-        label {
-            display: block;
-            margin-bottom: 5px;
-            font-weight: bold;
-            color: #34495e;
-        }
-        input[type="text"], textarea, select {
-            width: 100%;
-            padding: 10px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            font-size: 14px;
-        }
-        textarea {
-            height: 100px;
-            resize: vertical;
-        }
-        .checkbox-group {
-            display: flex;
-            gap: 15px;
-            flex-wrap: wrap;
-        }
-        .checkbox-item {
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }
-        button {
-            background-color: #3498db;
-            color: white;
-            padding: 12px 24px;
-            border: none;
-            border-radius: 5px;
-            cursor: pointer;
-            font-size: 16px;
-            margin-right: 10px;
-        }
-        button:hover {
-            background-color: #2980b9;
-        }
-        button:disabled {
-            background-color: #bdc3c7;
-            cursor: not-allowed;
-        }
-        .status {
-            margin-top: 20px;
-            padding: 15px;
-            border-radius: 5px;
-            display: none;
-        }
-        .status.success {
-            background-color: #d4edda;
-            color: #155724;
-            border: 1px solid #c3e6cb;
-        }
-        .status.error {
-            background-color: #f8d7da;
-            color: #721c24;
-            border: 1px solid #f5c6cb;
-        }
-        .download-links {
-            margin-top: 20px;
-        }
-        .download-links a {
-            display: inline-block;
-            margin-right: 10px;
-            padding: 8px 16px;
-            background-color: #27ae60;
-            color: white;
-            text-decoration: none;
-            border-radius: 5px;
-        }
-        .download-links a:hover {
-            background-color: #229954;
-        }
-        .config-status {
-            margin-bottom: 20px;
-            padding: 15px;
-            background-color: #e8f4fd;
-            border-radius: 5px;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🚀 SparkScraper Web Interface</h1>
-        
-        <div class="config-status" id="configStatus">
-            <strong>Configuration Status:</strong> Loading...
-        </div>
-        
-        <form id="scrapeForm">
-            <div class="form-group">
-                <label for="keywords">Keywords (comma-separated):</label>
-                <textarea id="keywords" name="keywords" placeholder="project ideas, startup ideas, side project"></textarea>
-            </div>
-            
-            <div class="form-group">
-                <label for="subreddits">Subreddits (comma-separated):</label>
-                <textarea id="subreddits" name="subreddits" placeholder="sideprojects, startups, entrepreneur"></textarea>
-            </div>
-            
-            <div class="form-group">
-                <label>Output Formats:</label>
-                <div class="checkbox-group">
-                    <div class="checkbox-item">
-                        <input type="checkbox" id="markdown" name="output_formats" value="markdown" checked>
-                        <label for="markdown">Markdown</label>
-                    </div>
-                    <div class="checkbox-item">
-                        <input type="checkbox" id="json" name="output_formats" value="json">
-                        <label for="json">JSON</label>
-                    </div>
-                    <div class="checkbox-item">
-                        <input type="checkbox" id="csv" name="output_formats" value="csv">
-                        <label for="csv">CSV</label>
-                    </div>
-                </div>
-            </div>
-            
-            <button type="submit" id="scrapeBtn">Start Scraping</button>
-            <button type="button" id="sampleBtn">Generate Sample</button>
-        </form>
-        
-        <div class="status" id="status"></div>
-        <div class="download-links" id="downloadLinks"></div>
-    </div>
+    response = Response(_sample_outputs()[format], mimetype=SAMPLE_MIMETYPES[format])
+    response.headers['Content-Disposition'] = f'attachment; filename=sparkscraper_ideas.{format}'
+    return response
 
-    <script>
-        // Load configuration on page load
-        fetch('/api/config')
-            .then(response => response.json())
-            .then(data => {
-                const configStatus = document.getElementById('configStatus');
-                const validation = data.validation;
-                
-                let statusHtml = '<strong>Configuration Status:</strong><br>';
-                for (const [service, configured] of Object.entries(validation)) {
-                    const status = configured ? '✅ Configured' : '❌ Not Configured';
-                    statusHtml += `${service.replace('_', ' ').toUpperCase()}: ${status}<br>`;
-                }
-                
-                configStatus.innerHTML = statusHtml;
-                
-                // Set default values
-                document.getElementById('keywords').value = data.default_keywords.join(', ');
-                document.getElementById('subreddits').value = data.default_subreddits.join(', ');
-            })
-            .catch(error => {
-                console.error('Error loading config:', error);
-            });
-
-        // Handle form submission
-        document.getElementById('scrapeForm').addEventListener('submit', function(e) {
-            e.preventDefault();
-            
-            const scrapeBtn = document.getElementById('scrapeBtn');
-            const status = document.getElementById('status');
-            const downloadLinks = document.getElementById('downloadLinks');
-            
-            // Get form data
-            const keywords = document.getElementById('keywords').value.split(',').map(k => k.trim()).filter(k => k);
-            const subreddits = document.getElementById('subreddits').value.split(',').map(s => s.trim()).filter(s => s);
-            const outputFormats = Array.from(document.querySelectorAll('input[name="output_formats"]:checked')).map(cb => cb.value);
-            
-            // Disable button and show loading
-            scrapeBtn.disabled = true;
-            scrapeBtn.textContent = 'Scraping...';
-            status.style.display = 'none';
-            downloadLinks.innerHTML = '';
-            
-            // Send request
-            fetch('/api/scrape', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    keywords: keywords,
-                    subreddits: subreddits,
-                    output_formats: outputFormats
-                })
-            })
-            .then(response => response.json())
-            .then(data => {
-                status.style.display = 'block';
-                
-                if (data.success) {
-                    status.className = 'status success';
-                    status.textContent = data.message;
-                    
-                    // Show download links
-                    let linksHtml = '<strong>Download Files:</strong><br>';
-                    data.output_files.forEach(format => {
-                        linksHtml += `<a href="/api/download/${format}" target="_blank">Download ${format.toUpperCase()}</a>`;
-                    });
-                    downloadLinks.innerHTML = linksHtml;
-                } else {
-                    status.className = 'status error';
-                    status.textContent = 'Error: ' + data.error;
-                }
-            })
-            .catch(error => {
-                status.style.display = 'block';
-                status.className = 'status error';
-                status.textContent = 'Error: ' + error.message;
-            })
-            .finally(() => {
-                scrapeBtn.disabled = false;
-                scrapeBtn.textContent = 'Start Scraping';
-            });
-        });
-
-        // Handle sample generation
-        document.getElementById('sampleBtn').addEventListener('click', function() {
-            const sampleBtn = this;
-            const status = document.getElementById('status');
-            const downloadLinks = document.getElementById('downloadLinks');
-            
-            sampleBtn.disabled = true;
-            sampleBtn.textContent = 'Generating...';
-            status.style.display = 'none';
-            downloadLinks.innerHTML = '';
-            
-            fetch('/api/sample')
-                .then(response => response.json())
-                .then(data => {
-                    status.style.display = 'block';
-                    
-                    if (data.success) {
-                        status.className = 'status success';
-                        status.textContent = data.message;
-                        
-                        // Show download links
-                        let linksHtml = '<strong>Download Sample Files:</strong><br>';
-                        data.files.forEach(filename => {
-                            const format = filename.split('.').pop();
-                            linksHtml += `<a href="/api/download/${format}" target="_blank">Download ${format.toUpperCase()}</a>`;
-                        });
-                        downloadLinks.innerHTML = linksHtml;
-                    } else {
-                        status.className = 'status error';
-                        status.textContent = 'Error: ' + data.error;
-                    }
-                })
-                .catch(error => {
-                    status.style.display = 'block';
-                    status.className = 'status error';
-                    status.textContent = 'Error: ' + error.message;
-                })
-                .finally(() => {
-                    sampleBtn.disabled = false;
-                    sampleBtn.textContent = 'Generate Sample';
-                });
-        });
-    </script>
-</body>
-</html>'''
-    
-    with open('templates/index.html', 'w') as f:
-        f.write(html_template)
-    
+if __name__ == '__main__':
+    # Development server only; deploy with gunicorn (see `make run-web`)
     print("🌐 Starting SparkScraper Web Interface...")
     print("📱 Open your browser and go to: http://localhost:5000")
-    app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
+    app.run(host='127.0.0.1', port=5000)